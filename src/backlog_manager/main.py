@@ -1,20 +1,59 @@
 from mcp.server.fastmcp import FastMCP, Context
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from collections.abc import AsyncIterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from dotenv import load_dotenv
 from enum import Enum
 import asyncio
+import errno
 import json
+import logging
+import mmap
 import os
-import uuid
+import secrets
+import sys
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Not available on Windows; sessions then don't lock the files
+    fcntl = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Default file paths
 DEFAULT_TASKS_FILE = "tasks.json"
 
+# Default delay in seconds before batched changes are written to disk
+DEFAULT_FLUSH_INTERVAL = 0.25
+
+# Default number of logged changes between rewrites of the tasks file
+DEFAULT_SNAPSHOT_EVERY = 100
+
+# Makes each write durable on return, without a separate fsync call
+_O_DSYNC = getattr(os, "O_DSYNC", 0)
+
+# Lets a directory be opened for fsync; not available on Windows
+_O_DIRECTORY = getattr(os, "O_DIRECTORY", None)
+
+# Most buffers a single writev call accepts, 1024 on Linux
+_IOV_MAX = os.sysconf("SC_IOV_MAX") if "SC_IOV_MAX" in getattr(os, "sysconf_names", {}) else 1024
+if _IOV_MAX <= 0:
+    _IOV_MAX = 16
+
+# Snapshots at least this large bypass the page cache where O_DIRECT is
+# supported, written in blocks of the given alignment
+_O_DIRECT = getattr(os, "O_DIRECT", 0)
+_DIRECT_IO_THRESHOLD = 1 << 20
+_DIRECT_IO_ALIGN = 4096
+
 # Task and Issue statuses
 class TaskStatus(str, Enum):
     NEW = "New"
@@ -26,11 +65,54 @@ class IssueStatus(str, Enum):
     IN_WORK = "InWork"
     DONE = "Done"
 
+# Interned status strings stored in task and issue data, so status
+# comparisons can short-circuit on identity
+_TASK_NEW = sys.intern(TaskStatus.NEW.value)
+_ISSUE_NEW = sys.intern(IssueStatus.NEW.value)
+
+# Valid status values and their error-message listing, computed once
+_TASK_STATUS_VALUES = frozenset(s.value for s in TaskStatus)
+_TASK_STATUS_LIST = ", ".join(s.value for s in TaskStatus)
+_ISSUE_STATUS_VALUES = frozenset(s.value for s in IssueStatus)
+_ISSUE_STATUS_LIST = ", ".join(s.value for s in IssueStatus)
+
 @dataclass
 class BacklogContext:
     """Context for the Backlog Manager MCP server."""
     tasks_file: str
     active_issue: str = None
+    # Seconds to batch changes before writing them; 0 writes on every change
+    flush_interval: float = 0
+    # Logged changes between tasks file rewrites; 1 rewrites it on every flush
+    snapshot_every: int = 1
+    # True while the cached data holds changes not yet written to disk
+    dirty: bool = False
+    # Parsed tasks file plus log, the tasks file mtime (in ns) and the log size
+    # (in bytes) they were read or written at, and the changes in that log
+    _cache: dict | None = None
+    _cache_mtime: int = 0
+    _log_size: int = 0
+    _logged_ops: int = 0
+    # Changes applied to the cache but not yet written to the log
+    _pending_ops: list = field(default_factory=list, repr=False)
+    # Bumped whenever the cached data changes, and the listing output last
+    # formatted for each (tool, active issue, status filter) with its version
+    _version: int = 0
+    _output_cache: dict = field(default_factory=dict, repr=False)
+    # Serializes file reloads and writes between concurrent tool calls
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+    # True while a flush is writing the cache out to disk
+    _flushing: bool = False
+    
+    @property
+    def log_file(self) -> str:
+        """Path to the append-only change log kept beside the tasks file."""
+        return self.tasks_file + ".log.jsonl"
+    
+    @property
+    def lock_file(self) -> str:
+        """Path to the file locked while writing the tasks file or its log."""
+        return self.tasks_file + ".lock"
 
 @asynccontextmanager
 async def backlog_lifespan(server: FastMCP) -> AsyncIterator[BacklogContext]:
@@ -45,10 +127,26 @@ async def backlog_lifespan(server: FastMCP) -> AsyncIterator[BacklogContext]:
     """
     tasks_file = os.getenv("TASKS_FILE", DEFAULT_TASKS_FILE)
     
+    # Get flush interval, defaulting if not set or if empty
+    flush_interval_str = os.getenv("FLUSH_INTERVAL")
+    flush_interval = float(flush_interval_str) if flush_interval_str and flush_interval_str.strip() else DEFAULT_FLUSH_INTERVAL
+    
+    # Get snapshot frequency, defaulting if not set or if empty
+    snapshot_every_str = os.getenv("SNAPSHOT_EVERY")
+    snapshot_every = int(snapshot_every_str) if snapshot_every_str and snapshot_every_str.strip() else DEFAULT_SNAPSHOT_EVERY
+    
+    context = BacklogContext(tasks_file=tasks_file, flush_interval=flush_interval, snapshot_every=snapshot_every)
+    flusher = asyncio.create_task(_flush_periodically(context)) if flush_interval > 0 else None
+    
     try:
-        yield BacklogContext(tasks_file=tasks_file)
+        yield context
     finally:
-        pass
+        if flusher:
+            flusher.cancel()
+            with suppress(asyncio.CancelledError):
+                await flusher
+        # Write out anything still pending and fold the log into the tasks file
+        await _flush_tasks(context, snapshot=True)
 
 # Initialize FastMCP server
 # Get port, defaulting to 8050 if not set or if empty
@@ -63,45 +161,614 @@ mcp = FastMCP(
     port=port
 )
 
-def _load_tasks(file_path: str) -> dict:
+def _json_loads(raw: bytes) -> dict:
+    """
+    Parse JSON bytes, using orjson when it is available.
+    
+    Args:
+        raw: Encoded JSON document
+        
+    Returns:
+        dict: The decoded document
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _json_dumps(data: dict) -> bytes:
+    """
+    Serialize data to indented JSON bytes, using orjson when it is available.
+    
+    Args:
+        data: Dictionary to serialize
+        
+    Returns:
+        bytes: The encoded document
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+def _json_dumps_line(data: dict) -> bytes:
+    """
+    Serialize data to a single newline-terminated line of JSON bytes.
+    
+    Args:
+        data: Dictionary to serialize
+        
+    Returns:
+        bytes: The encoded line
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(data).encode("utf-8") + b"\n"
+
+def _new_issue(description: str, status: str) -> dict:
+    """
+    Build the in-memory representation of an issue with no tasks.
+    
+    Tasks are held column-wise in parallel dicts keyed by task ID, so scans
+    over one field (usually the status) don't touch the others. Each task's
+    position records the order tasks were added in.
+    
+    Args:
+        description: A detailed description of the issue
+        status: The status of the issue
+        
+    Returns:
+        dict: The issue data, including an empty task-by-status index
+    """
+    return {
+        "description": description,
+        "status": status,
+        "title_by_id": {},
+        "desc_by_id": {},
+        "status_by_id": {},
+        "pos_by_id": {},
+        "tasks_by_status": {s.value: {} for s in TaskStatus}
+    }
+
+def _index_tasks_by_status(status_by_id: dict) -> dict:
+    """
+    Build the task-by-status index for an issue's tasks.
+    
+    Args:
+        status_by_id: The issue's task statuses keyed by task ID
+        
+    Returns:
+        dict: Task IDs keyed by task status, each held as the keys of a dict
+        so tasks can be moved between statuses in constant time
+    """
+    index = {s.value: {} for s in TaskStatus}
+    for task_id, status in status_by_id.items():
+        index.setdefault(status, {})[task_id] = None
+    return index
+
+def _issue_from_stored(issue_data: dict) -> dict:
+    """
+    Convert an issue as stored in the tasks file to its in-memory representation.
+    
+    Args:
+        issue_data: The issue with its tasks as a dict of task dicts
+        
+    Returns:
+        dict: The issue with its tasks split into per-field dicts
+    """
+    tasks = issue_data.get("tasks", {})
+    # Intern statuses read from disk to match those set by the tools, treating
+    # missing and null ones as new
+    status_by_id = {task_id: sys.intern(task.get("status") or _TASK_NEW) for task_id, task in tasks.items()}
+    
+    return {
+        "description": issue_data.get("description", ""),
+        "status": sys.intern(issue_data.get("status") or _ISSUE_NEW),
+        "title_by_id": {task_id: task.get("title", "") for task_id, task in tasks.items()},
+        "desc_by_id": {task_id: task.get("description", "") for task_id, task in tasks.items()},
+        "status_by_id": status_by_id,
+        "pos_by_id": {task_id: pos for pos, task_id in enumerate(tasks)},
+        # Derived from the task statuses, so it can never disagree with them
+        "tasks_by_status": _index_tasks_by_status(status_by_id)
+    }
+
+def _tasks_to_stored(data: dict) -> dict:
+    """
+    Convert in-memory tasks data back to the layout stored in the tasks file.
+    
+    Args:
+        data: Dictionary containing issues and tasks data
+        
+    Returns:
+        dict: The same data with each issue's tasks as a dict of task dicts
+    """
+    issues = {}
+    for issue_name, issue_data in data["issues"].items():
+        title_by_id = issue_data["title_by_id"]
+        desc_by_id = issue_data["desc_by_id"]
+        issues[issue_name] = {
+            "description": issue_data["description"],
+            "status": issue_data["status"],
+            "tasks": {
+                task_id: {
+                    "title": title_by_id[task_id],
+                    "description": desc_by_id[task_id],
+                    "status": status
+                }
+                for task_id, status in issue_data["status_by_id"].items()
+            }
+        }
+    return {"issues": issues}
+
+def _apply_op(data: dict, op: dict) -> None:
+    """
+    Apply a logged change to the tasks data.
+    
+    Changes are idempotent, so replaying a log over a tasks file that already
+    contains some of them gives the same result.
+    
+    Args:
+        data: Dictionary containing issues and tasks data
+        op: The change to apply
+    """
+    issues = data["issues"]
+    kind = op["op"]
+    
+    if kind == "init_issue":
+        issues[op["issue"]] = _new_issue(op["description"], sys.intern(op["status"]))
+    elif kind == "update_issue_status":
+        issues[op["issue"]]["status"] = sys.intern(op["status"])
+    elif kind == "add_task":
+        issue_data = issues[op["issue"]]
+        status_by_id = issue_data["status_by_id"]
+        tasks_by_status = issue_data["tasks_by_status"]
+        pos_by_id = issue_data["pos_by_id"]
+        task_id = op["id"]
+        
+        # Update the index first so a failure leaves the data unchanged
+        if task_id in status_by_id:
+            del tasks_by_status[status_by_id[task_id]][task_id]
+        tasks_by_status[_TASK_NEW][task_id] = None
+        # A replayed task keeps the position it was first added at
+        pos_by_id.setdefault(task_id, len(pos_by_id))
+        issue_data["title_by_id"][task_id] = op["title"]
+        issue_data["desc_by_id"][task_id] = op["description"]
+        status_by_id[task_id] = _TASK_NEW
+    elif kind == "update_task_status":
+        issue_data = issues[op["issue"]]
+        task_id = op["id"]
+        status = sys.intern(op["status"])
+        status_by_id = issue_data["status_by_id"]
+        old_status = status_by_id[task_id]
+        
+        # Move the task to its new status bucket before updating the status,
+        # so a failure leaves the data unchanged
+        if old_status != status:
+            tasks_by_status = issue_data["tasks_by_status"]
+            del tasks_by_status[old_status][task_id]
+            tasks_by_status.setdefault(status, {})[task_id] = None
+        status_by_id[task_id] = status
+    else:
+        raise ValueError(f"Unknown operation '{kind}'")
+
+def _file_state(context: BacklogContext) -> tuple[int, int]:
+    """
+    Get the current on-disk state of the tasks file and its log.
+    
+    Args:
+        context: The backlog context holding the tasks file path
+        
+    Returns:
+        tuple[int, int]: The tasks file mtime in nanoseconds and the log size
+        in bytes, each 0 when the file does not exist
+    """
+    file_path = context.tasks_file
+    log_path = context.log_file
+    mtime = os.stat(file_path).st_mtime_ns if os.path.exists(file_path) else 0
+    log_size = os.stat(log_path).st_size if os.path.exists(log_path) else 0
+    return mtime, log_size
+
+def _read_file(file_path: str) -> bytes:
+    """
+    Read a file's contents, treating a missing file as empty.
+    
+    Args:
+        file_path: Path to the file
+        
+    Returns:
+        bytes: The file contents
+    """
+    try:
+        return Path(file_path).read_bytes()
+    except FileNotFoundError:
+        return b""
+
+def _write_fd(fd: int, chunks: list[bytes]) -> None:
+    """
+    Write chunks straight to a file descriptor, bypassing Python's buffering.
+    
+    Args:
+        fd: Open file descriptor
+        chunks: Byte strings to write, in order
+    """
+    # Gather chunks into as few syscalls as the platform's buffer limit allows
+    for start in range(0, len(chunks), _IOV_MAX):
+        group = chunks[start:start + _IOV_MAX]
+        total = sum(map(len, group))
+        written = os.writev(fd, group) if hasattr(os, "writev") else 0
+        if written < total:
+            # Fall back to plain writes for whatever the kernel did not accept
+            view = memoryview(b"".join(group))[written:]
+            while view:
+                view = view[os.write(fd, view):]
+
+def _append_file(file_path: str, chunks: list[bytes]) -> int:
+    """
+    Durably append chunks to a file in a single call.
+    
+    A failed append is cut back off the file, so a retry never lands after
+    a torn partial line.
+    
+    Args:
+        file_path: Path to the file
+        chunks: Byte strings to append, in order
+        
+    Returns:
+        int: The size of the file after the append
+    """
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND | _O_DSYNC, 0o644)
+    try:
+        size = os.fstat(fd).st_size
+        try:
+            _write_fd(fd, chunks)
+        except BaseException:
+            os.ftruncate(fd, size)
+            raise
+        return os.fstat(fd).st_size
+    finally:
+        os.close(fd)
+
+def _lock_file(file_path: str) -> int:
+    """
+    Take an exclusive lock on a file, waiting until no other holder has it.
+    
+    Args:
+        file_path: Path to the lock file, created if missing
+        
+    Returns:
+        int: The open file descriptor holding the lock; closing it releases it
+    """
+    fd = os.open(file_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd
+
+@asynccontextmanager
+async def _locked_files(context: BacklogContext) -> AsyncIterator[None]:
+    """
+    Hold the lock shared by every session writing the tasks file and its log.
+    
+    Each session has its own context and context lock, so this is what keeps
+    one session's log append from landing mid-snapshot in another.
+    
+    Args:
+        context: The backlog context holding the tasks file path
+    """
+    if fcntl is None:
+        yield
+        return
+    
+    # Wait for the lock off the event loop
+    acquire = asyncio.ensure_future(asyncio.to_thread(_lock_file, context.lock_file))
+    try:
+        fd = await asyncio.shield(acquire)
+    except asyncio.CancelledError:
+        # Release the lock once the worker thread takes it, or it is held forever
+        acquire.add_done_callback(lambda f: f.cancelled() or f.exception() or os.close(f.result()))
+        raise
+    try:
+        yield
+    finally:
+        os.close(fd)
+
+def _write_direct(file_path: str, payload: bytes) -> int:
     """
-    Load tasks from a JSON file.
+    Write a payload with O_DIRECT from an aligned buffer, skipping the page cache.
+    
+    Args:
+        file_path: Path to the file
+        payload: Bytes to write
+        
+    Returns:
+        int: The file's mtime in nanoseconds after the write
+        
+    Raises:
+        OSError: With errno EINVAL if the filesystem does not support O_DIRECT
+    """
+    size = len(payload)
+    padded_size = -(-size // _DIRECT_IO_ALIGN) * _DIRECT_IO_ALIGN
+    
+    # Anonymous mappings are page aligned and zero filled
+    buffer = mmap.mmap(-1, padded_size)
+    try:
+        buffer[:size] = payload
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_DIRECT | _O_DSYNC, 0o644)
+        try:
+            with memoryview(buffer) as view:
+                offset = 0
+                while offset < padded_size:
+                    offset += os.write(fd, view[offset:])
+            # Drop the padding written to fill the last block
+            os.ftruncate(fd, size)
+            return os.fstat(fd).st_mtime_ns
+        finally:
+            os.close(fd)
+    finally:
+        buffer.close()
+
+def _fsync_dir(dir_path: str) -> None:
+    """
+    Flush a directory's entries to disk, making renames within it durable.
+    
+    Args:
+        dir_path: Path to the directory
+    """
+    if _O_DIRECTORY is None:
+        return
+    fd = os.open(dir_path or ".", os.O_RDONLY | _O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def _write_snapshot(file_path: str, log_path: str, payload: bytes) -> int:
+    """
+    Atomically rewrite the tasks file, then empty the change log it now contains.
+    
+    The payload is durably written to a temporary file that replaces the tasks
+    file, so a crash mid-write never leaves a truncated tasks file behind, and
+    the rename is flushed to disk before the log is emptied.
+    Large payloads are written with O_DIRECT where the filesystem allows it.
     
     Args:
         file_path: Path to the tasks file
+        log_path: Path to the change log
+        payload: Encoded tasks data
+        
+    Returns:
+        int: The tasks file's mtime in nanoseconds after the write
+    """
+    # Unique per write so concurrent snapshots never share a temporary file
+    tmp_path = f"{file_path}.{secrets.token_hex(4)}.tmp"
+    mtime = None
+    try:
+        if _O_DIRECT and len(payload) >= _DIRECT_IO_THRESHOLD:
+            try:
+                mtime = _write_direct(tmp_path, payload)
+            except OSError as e:
+                # Not supported by this filesystem; use a buffered write instead
+                if e.errno != errno.EINVAL:
+                    raise
+        
+        if mtime is None:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_DSYNC, 0o644)
+            try:
+                _write_fd(fd, [payload])
+                mtime = os.fstat(fd).st_mtime_ns
+            finally:
+                os.close(fd)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        # Don't leave a stray temporary file behind after a failed write
+        with suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
+    # The rename must be on disk before the log it replaces is emptied
+    _fsync_dir(os.path.dirname(file_path))
+    if os.path.exists(log_path):
+        os.truncate(log_path, 0)
+    return mtime
+
+async def _read_tasks(context: BacklogContext) -> dict:
+    """
+    Read the tasks file and replay its change log into the cache.
+    
+    Must be called with the context lock held.
+    
+    Args:
+        context: The backlog context holding the tasks file path and cache
+        
+    Returns:
+        dict: Dictionary containing issues and tasks data
+    """
+    mtime, _ = _file_state(context)
+    
+    data = {"issues": {}}
+    if mtime:
+        try:
+            # Read off the event loop so other tool calls keep running
+            data = _json_loads(await asyncio.to_thread(Path(context.tasks_file).read_bytes))
+        except Exception:
+            # An unreadable tasks file is treated as an empty backlog
+            logger.exception("Error loading tasks")
+        
+        # Ensure issues key exists
+        if not isinstance(data, dict) or "issues" not in data:
+            data = {"issues": {}}
+        
+        data = {"issues": {name: _issue_from_stored(issue_data) for name, issue_data in data["issues"].items()}}
+    
+    log = await asyncio.to_thread(_read_file, context.log_file)
+    logged_ops = 0
+    for line in log.splitlines():
+        try:
+            _apply_op(data, _json_loads(line))
+            logged_ops += 1
+        except Exception as e:
+            # Skip torn writes and changes that no longer apply
+            logger.warning("Skipping task log entry: %s", e)
+    
+    context._cache = data
+    context._cache_mtime = mtime
+    context._log_size = len(log)
+    context._logged_ops = logged_ops
+    context._version += 1
+    return data
+
+async def _load_tasks(context: BacklogContext) -> dict:
+    """
+    Load tasks from the JSON file and its change log, reusing the cached copy
+    while neither has changed.
+    
+    Args:
+        context: The backlog context holding the tasks file path and cache
         
     Returns:
         dict: Dictionary containing issues and tasks data
     """
+    # Pending changes are newer than anything on disk, and a flush in progress
+    # is writing out the cache itself
+    if context.dirty or context._flushing:
+        return context._cache
+    
     try:
-        if not os.path.exists(file_path):
-            return {"issues": {}}
+        # A valid cache needs no lock, so reads never wait on a flush
+        if context._cache is not None and _file_state(context) == (context._cache_mtime, context._log_size):
+            return context._cache
         
-        with open(file_path, "r") as f:
-            data = json.load(f)
-            
-            # Ensure issues key exists
-            if "issues" not in data:
-                data = {"issues": {}}
-            
-            return data
-    except Exception as e:
-        print(f"Error loading tasks: {str(e)}")
+        # Hold the lock to reload so concurrent tool calls share one parsed copy
+        async with context._lock:
+            if context._cache is not None and _file_state(context) == (context._cache_mtime, context._log_size):
+                return context._cache
+            return await _read_tasks(context)
+    except Exception:
+        logger.exception("Error loading tasks")
         return {"issues": {}}
 
-def _save_tasks(file_path: str, data: dict) -> None:
+def _cached_output(context: BacklogContext, key: tuple) -> str | None:
     """
-    Save tasks to a JSON file.
+    Get listing output formatted earlier from the current cached data.
     
     Args:
-        file_path: Path to the tasks file
-        data: Dictionary containing tasks data
+        context: The backlog context holding the output cache
+        key: The tool, active issue and status filter the output was built for
+        
+    Returns:
+        str | None: The output, or None if it is missing or out of date
     """
-    try:
-        with open(file_path, "w") as f:
-            json.dump(data, f, indent=2)
-    except Exception as e:
-        print(f"Error saving tasks: {str(e)}")
+    cached = context._output_cache.get(key)
+    if cached is not None and cached[0] == context._version:
+        return cached[1]
+    return None
+
+def _store_output(context: BacklogContext, key: tuple, output: str) -> str:
+    """
+    Remember listing output formatted from the current cached data.
+    
+    Args:
+        context: The backlog context holding the output cache
+        key: The tool, active issue and status filter the output was built for
+        output: The formatted output
+        
+    Returns:
+        str: The output, for returning directly
+    """
+    context._output_cache[key] = (context._version, output)
+    return output
+
+async def _commit_tasks(context: BacklogContext, data: dict, op: dict) -> None:
+    """
+    Apply a change to the tasks data and record it for the next flush.
+    
+    The change is written immediately unless batching is enabled.
+    
+    Args:
+        context: The backlog context holding the tasks file path and cache
+        data: Dictionary containing the loaded tasks data
+        op: The change to apply
+    """
+    _apply_op(data, op)
+    context._cache = data
+    context._version += 1
+    context._pending_ops.append(op)
+    context.dirty = True
+    if context.flush_interval <= 0:
+        await _flush_tasks(context)
+
+async def _flush_tasks(context: BacklogContext, snapshot: bool = False) -> None:
+    """
+    Write pending changes to the change log, rewriting the tasks file instead
+    once enough changes have been logged.
+    
+    Args:
+        context: The backlog context holding the tasks file path and cache
+        snapshot: Whether to rewrite the tasks file regardless of the log length
+    """
+    if not context.dirty and not (snapshot and context._logged_ops):
+        return
+    
+    async with context._lock:
+        ops = context._pending_ops
+        # Cleared before writing so changes made meanwhile stay pending
+        context._pending_ops = []
+        context.dirty = False
+        try:
+            # Keep other sessions from writing the files between the state
+            # check here and the log append or snapshot replace and truncate
+            async with _locked_files(context):
+                snapshot = snapshot or context._logged_ops + len(ops) >= context.snapshot_every
+                in_sync = _file_state(context) == (context._cache_mtime, context._log_size)
+                
+                # A snapshot of unchanged files already holds the new changes, so
+                # only log them when not snapshotting or when another writer has
+                # touched the files and the cache must be rebuilt from disk
+                if ops and not (snapshot and in_sync):
+                    lines = [_json_dumps_line(op) for op in ops]
+                    # Reads keep using the cache while it is the data being written
+                    context._flushing = in_sync
+                    try:
+                        log_size = await asyncio.to_thread(_append_file, context.log_file, lines)
+                    finally:
+                        context._flushing = False
+                    context._logged_ops += len(ops)
+                    if in_sync:
+                        context._log_size = log_size
+                    ops = []
+                
+                if snapshot:
+                    if not in_sync:
+                        # Rebuild from disk, then re-apply changes made since
+                        data = await _read_tasks(context)
+                        for op in context._pending_ops:
+                            _apply_op(data, op)
+                
+                    # Serialize on the event loop so the data can't change
+                    # mid-encode, then hand the write to a worker thread
+                    payload = _json_dumps(_tasks_to_stored(context._cache))
+                    context._flushing = True
+                    try:
+                        context._cache_mtime = await asyncio.to_thread(_write_snapshot, context.tasks_file, context.log_file, payload)
+                    finally:
+                        context._flushing = False
+                    context._log_size = 0
+                    context._logged_ops = 0
+        except Exception:
+            # Keep the changes in memory so the next flush can retry them
+            context._pending_ops = ops + context._pending_ops
+            context.dirty = True
+            logger.exception("Error saving tasks")
+
+async def _flush_periodically(context: BacklogContext) -> None:
+    """
+    Flush pending changes every flush interval until cancelled.
+    
+    Args:
+        context: The backlog context holding the tasks file path and cache
+    """
+    while True:
+        await asyncio.sleep(context.flush_interval)
+        await _flush_tasks(context)
 
 @mcp.tool()
 async def create_issue(ctx: Context, name: str, description: str = "", status: str = IssueStatus.NEW) -> str:
@@ -117,25 +784,28 @@ async def create_issue(ctx: Context, name: str, description: str = "", status: s
         status: The status of the issue (New, InWork, or Done)
     """
     try:
-        tasks_file = ctx.request_context.lifespan_context.tasks_file
-        data = _load_tasks(tasks_file)
+        backlog_ctx = ctx.request_context.lifespan_context
+        data = await _load_tasks(backlog_ctx)
         
         if name in data["issues"]:
             return f"Error: Issue '{name}' already exists."
         
         # Validate status if provided
-        if status not in [s.value for s in IssueStatus]:
-            return f"Error: Invalid status '{status}'. Valid values are: {', '.join([s.value for s in IssueStatus])}"
+        if status not in _ISSUE_STATUS_VALUES:
+            return f"Error: Invalid status '{status}'. Valid values are: {_ISSUE_STATUS_LIST}"
+        
+        # Store the interned plain string so the cached and on-disk data agree
+        status = sys.intern(IssueStatus(status).value)
         
-        data["issues"][name] = {
+        await _commit_tasks(backlog_ctx, data, {
+            "op": "init_issue",
+            "issue": name,
             "description": description,
-            "status": status,
-            "tasks": {}
-        }
-        _save_tasks(tasks_file, data)
+            "status": status
+        })
         
         # Set the created issue as active
-        ctx.request_context.lifespan_context.active_issue = name
+        backlog_ctx.active_issue = name
         
         return f"Successfully created issue: {name} with status: {status}"
     except Exception as e:
@@ -151,30 +821,37 @@ async def list_issues(ctx: Context) -> str:
         ctx: The MCP server provided context
     """
     try:
-        tasks_file = ctx.request_context.lifespan_context.tasks_file
-        data = _load_tasks(tasks_file)
+        backlog_ctx = ctx.request_context.lifespan_context
+        data = await _load_tasks(backlog_ctx)
         
-        if not data["issues"]:
+        issues = data["issues"]
+        if not issues:
             return "No issues found. Use 'create_issue' to create a new issue."
         
-        active_issue = ctx.request_context.lifespan_context.active_issue
+        active_issue = backlog_ctx.active_issue
+        
+        # Reuse the last output while nothing has changed
+        output_key = ("list_issues", active_issue)
+        output = _cached_output(backlog_ctx, output_key)
+        if output is not None:
+            return output
         
-        result = ["Available issues:"]
-        for issue_name, issue_data in data["issues"].items():
-            task_count = len(issue_data["tasks"])
+        # One entry per issue after the header
+        result = [None] * (len(issues) + 1)
+        result[0] = "Available issues:"
+        for i, (issue_name, issue_data) in enumerate(issues.items(), 1):
+            task_count = len(issue_data["status_by_id"])
             active_marker = " (active)" if issue_name == active_issue else ""
-            description_preview = issue_data.get("description", "")[:30]
-            if description_preview and len(issue_data.get("description", "")) > 30:
-                description_preview += "..."
+            description = issue_data.get("description") or ""
+            description_preview = description[:30] + ("..." if len(description) > 30 else "") if description else ""
             
             # Handle missing status for backward compatibility
-            status = issue_data.get("status", IssueStatus.NEW)
+            status = issue_data.get("status", _ISSUE_NEW)
             
-            result.append(f"- {issue_name}{active_marker}: Status: {status}, Tasks: {task_count}")
-            if description_preview:
-                result.append(f"  Description: {description_preview}")
+            entry = f"- {issue_name}{active_marker}: Status: {status}, Tasks: {task_count}"
+            result[i] = f"{entry}\n  Description: {description_preview}" if description_preview else entry
         
-        return "\n".join(result)
+        return _store_output(backlog_ctx, output_key, "\n".join(result))
     except Exception as e:
         return f"Error listing issues: {str(e)}"
 
@@ -189,13 +866,13 @@ async def select_issue(ctx: Context, name: str) -> str:
         name: The name of the issue to select
     """
     try:
-        tasks_file = ctx.request_context.lifespan_context.tasks_file
-        data = _load_tasks(tasks_file)
+        backlog_ctx = ctx.request_context.lifespan_context
+        data = await _load_tasks(backlog_ctx)
         
         if name not in data["issues"]:
             return f"Error: Issue '{name}' not found."
         
-        ctx.request_context.lifespan_context.active_issue = name
+        backlog_ctx.active_issue = name
         return f"Selected issue: {name}"
     except Exception as e:
         return f"Error selecting issue: {str(e)}"
@@ -214,24 +891,26 @@ async def initialize_issue(ctx: Context, name: str, description: str = "", statu
         status: The status of the issue (New, InWork, or Done)
     """
     try:
-        tasks_file = ctx.request_context.lifespan_context.tasks_file
-        data = _load_tasks(tasks_file)
+        backlog_ctx = ctx.request_context.lifespan_context
+        data = await _load_tasks(backlog_ctx)
         
         # Validate status if provided
-        if status not in [s.value for s in IssueStatus]:
-            return f"Error: Invalid status '{status}'. Valid values are: {', '.join([s.value for s in IssueStatus])}"
+        if status not in _ISSUE_STATUS_VALUES:
+            return f"Error: Invalid status '{status}'. Valid values are: {_ISSUE_STATUS_LIST}"
+        
+        # Store the interned plain string so the cached and on-disk data agree
+        status = sys.intern(IssueStatus(status).value)
         
         # Clear existing tasks if issue exists
-        data["issues"][name] = {
+        await _commit_tasks(backlog_ctx, data, {
+            "op": "init_issue",
+            "issue": name,
             "description": description,
-            "status": status,
-            "tasks": {}
-        }
-        
-        _save_tasks(tasks_file, data)
+            "status": status
+        })
         
         # Set this issue as active
-        ctx.request_context.lifespan_context.active_issue = name
+        backlog_ctx.active_issue = name
         
         return f"Successfully initialized issue: {name} with status: {status}"
     except Exception as e:
@@ -250,26 +929,31 @@ async def add_task(ctx: Context, title: str, description: str = "") -> str:
         description: A detailed description of the task (optional)
     """
     try:
-        tasks_file = ctx.request_context.lifespan_context.tasks_file
-        active_issue = ctx.request_context.lifespan_context.active_issue
+        backlog_ctx = ctx.request_context.lifespan_context
+        active_issue = backlog_ctx.active_issue
         
         if not active_issue:
             return "Error: No active issue. Please select an issue using 'select_issue' first."
         
-        data = _load_tasks(tasks_file)
+        data = await _load_tasks(backlog_ctx)
         
-        if active_issue not in data["issues"]:
+        issue_data = data["issues"].get(active_issue)
+        if issue_data is None:
             return f"Error: Issue '{active_issue}' not found."
         
-        task_id = str(uuid.uuid4())[:8]  # Generate a short unique ID
+        # Generate a short unique ID, retrying on the rare collision
+        status_by_id = issue_data["status_by_id"]
+        task_id = secrets.token_hex(4)
+        while task_id in status_by_id:
+            task_id = secrets.token_hex(4)
         
-        data["issues"][active_issue]["tasks"][task_id] = {
+        await _commit_tasks(backlog_ctx, data, {
+            "op": "add_task",
+            "issue": active_issue,
+            "id": task_id,
             "title": title,
-            "description": description,
-            "status": TaskStatus.NEW
-        }
-        
-        _save_tasks(tasks_file, data)
+            "description": description
+        })
         return f"Successfully added task: {title} (ID: {task_id}) to issue '{active_issue}'"
     except Exception as e:
         return f"Error adding task: {str(e)}"
@@ -286,50 +970,62 @@ async def list_tasks(ctx: Context, status: str = None) -> str:
         status: Optional status to filter tasks by (New, InWork, or Done)
     """
     try:
-        tasks_file = ctx.request_context.lifespan_context.tasks_file
-        active_issue = ctx.request_context.lifespan_context.active_issue
+        backlog_ctx = ctx.request_context.lifespan_context
+        active_issue = backlog_ctx.active_issue
         
         if not active_issue:
             return "Error: No active issue. Please select an issue using 'select_issue' first."
         
-        data = _load_tasks(tasks_file)
+        data = await _load_tasks(backlog_ctx)
         
-        if active_issue not in data["issues"]:
+        issue_data = data["issues"].get(active_issue)
+        if issue_data is None:
             return f"Error: Issue '{active_issue}' not found."
         
-        issue_data = data["issues"][active_issue]
-        issue_tasks = issue_data["tasks"]
+        status_by_id = issue_data["status_by_id"]
         
-        if len(issue_tasks) == 0:
+        if len(status_by_id) == 0:
             return f"No tasks found in issue '{active_issue}'."
         
         # Validate status if provided
-        if status and status not in [s.value for s in TaskStatus]:
-            return f"Error: Invalid status '{status}'. Valid values are: {', '.join([s.value for s in TaskStatus])}"
+        if status and status not in _TASK_STATUS_VALUES:
+            return f"Error: Invalid status '{status}'. Valid values are: {_TASK_STATUS_LIST}"
+        
+        # Only visit the tasks in the requested status when filtering
+        task_ids = issue_data["tasks_by_status"].get(status, ()) if status else status_by_id
+        
+        # The issue has tasks, so an empty selection means none match the filter
+        if not task_ids:
+            return f"No tasks found with status '{status}'"
+        
+        # Reuse the last output while nothing has changed
+        output_key = ("list_tasks", active_issue, status)
+        output = _cached_output(backlog_ctx, output_key)
+        if output is not None:
+            return output
+        
+        # Status buckets are in status-change order, so list the matches in
+        # the order they were added, as the unfiltered listing does
+        if status:
+            task_ids = sorted(task_ids, key=issue_data["pos_by_id"].__getitem__)
         
-        # Build the task list
-        result = [f"Tasks for issue: {active_issue}"]
+        # Build the task list, one entry per task after the header
+        result = [None] * (len(task_ids) + 1)
+        result[0] = f"Tasks for issue: {active_issue}"
         
         # Add issue description if available
-        if issue_data.get("description"):
-            result.append(f"Issue description: {issue_data['description']}")
+        issue_description = issue_data.get("description")
+        if issue_description:
+            result[0] += f"\nIssue description: {issue_description}"
         
-        for task_id, task in issue_tasks.items():
-            # Skip if filtering by status and this task doesn't match
-            if status and task["status"] != status:
-                continue
-                
-            result.append(f"\nID: {task_id}")
-            result.append(f"Title: {task['title']}")
-            result.append(f"Status: {task['status']}")
-            
-            if task["description"]:
-                result.append(f"Description: {task['description']}")
+        title_by_id = issue_data["title_by_id"]
+        desc_by_id = issue_data["desc_by_id"]
+        for i, task_id in enumerate(task_ids, 1):
+            entry = f"\nID: {task_id}\nTitle: {title_by_id[task_id]}\nStatus: {status_by_id[task_id]}"
+            task_description = desc_by_id[task_id]
+            result[i] = f"{entry}\nDescription: {task_description}" if task_description else entry
         
-        if len(result) == 1 or (len(result) == 2 and issue_data.get("description")):  # Only has the issue name and possibly description
-            return f"No tasks found with status '{status}'" if status else "No tasks found"
-            
-        return "\n".join(result)
+        return _store_output(backlog_ctx, output_key, "\n".join(result))
     except Exception as e:
         return f"Error listing tasks: {str(e)}"
 
@@ -346,32 +1042,43 @@ async def update_task_status(ctx: Context, task_id: str, status: str) -> str:
         status: The new status (New, InWork, or Done)
     """
     try:
-        tasks_file = ctx.request_context.lifespan_context.tasks_file
-        active_issue = ctx.request_context.lifespan_context.active_issue
+        backlog_ctx = ctx.request_context.lifespan_context
+        active_issue = backlog_ctx.active_issue
         
         if not active_issue:
             return "Error: No active issue. Please select an issue using 'select_issue' first."
         
-        data = _load_tasks(tasks_file)
+        data = await _load_tasks(backlog_ctx)
         
-        if active_issue not in data["issues"]:
+        issue_data = data["issues"].get(active_issue)
+        if issue_data is None:
             return f"Error: Issue '{active_issue}' not found."
         
-        issue_tasks = data["issues"][active_issue]["tasks"]
+        status_by_id = issue_data["status_by_id"]
         
-        if task_id not in issue_tasks:
+        if task_id not in status_by_id:
             return f"Error: Task with ID '{task_id}' not found in issue '{active_issue}'."
         
         # Validate status
-        if status not in [s.value for s in TaskStatus]:
-            return f"Error: Invalid status '{status}'. Valid values are: {', '.join([s.value for s in TaskStatus])}"
+        if status not in _TASK_STATUS_VALUES:
+            return f"Error: Invalid status '{status}'. Valid values are: {_TASK_STATUS_LIST}"
+        
+        # Update task status, storing the interned plain string
+        status = sys.intern(TaskStatus(status).value)
+        old_status = status_by_id[task_id]
         
-        # Update task status
-        old_status = issue_tasks[task_id]["status"]
-        issue_tasks[task_id]["status"] = status
-        _save_tasks(tasks_file, data)
+        # Nothing to record when the task already has this status
+        if old_status == status:
+            return f"Task '{issue_data['title_by_id'][task_id]}' (ID: {task_id}) already has status '{status}'."
         
-        return f"Successfully updated task '{issue_tasks[task_id]['title']}' (ID: {task_id}) status from '{old_status}' to '{status}'."
+        await _commit_tasks(backlog_ctx, data, {
+            "op": "update_task_status",
+            "issue": active_issue,
+            "id": task_id,
+            "status": status
+        })
+        
+        return f"Successfully updated task '{issue_data['title_by_id'][task_id]}' (ID: {task_id}) status from '{old_status}' to '{status}'."
     except Exception as e:
         return f"Error updating task: {str(e)}"
 
@@ -389,20 +1096,29 @@ async def update_issue_status(ctx: Context, name: str, status: str) -> str:
         status: The new status (New, InWork, or Done)
     """
     try:
-        tasks_file = ctx.request_context.lifespan_context.tasks_file
-        data = _load_tasks(tasks_file)
+        backlog_ctx = ctx.request_context.lifespan_context
+        data = await _load_tasks(backlog_ctx)
         
         if name not in data["issues"]:
             return f"Error: Issue '{name}' not found."
         
         # Validate status
-        if status not in [s.value for s in IssueStatus]:
-            return f"Error: Invalid status '{status}'. Valid values are: {', '.join([s.value for s in IssueStatus])}"
+        if status not in _ISSUE_STATUS_VALUES:
+            return f"Error: Invalid status '{status}'. Valid values are: {_ISSUE_STATUS_LIST}"
+        
+        # Update issue status, storing the interned plain string
+        status = sys.intern(IssueStatus(status).value)
+        old_status = data["issues"][name].get("status", _ISSUE_NEW)
+        
+        # Nothing to record when the issue already has this status
+        if old_status == status:
+            return f"Issue '{name}' already has status '{status}'."
         
-        # Update issue status
-        old_status = data["issues"][name].get("status", IssueStatus.NEW)
-        data["issues"][name]["status"] = status
-        _save_tasks(tasks_file, data)
+        await _commit_tasks(backlog_ctx, data, {
+            "op": "update_issue_status",
+            "issue": name,
+            "status": status
+        })
         
         return f"Successfully updated issue '{name}' status from '{old_status}' to '{status}'."
     except Exception as e:
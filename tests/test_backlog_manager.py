@@ -1,7 +1,11 @@
 import pytest
+import asyncio
+import errno
 import os
+import stat
 import json
 import tempfile
+import time
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
@@ -11,10 +15,19 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../s
 
 from backlog_manager.main import (
     BacklogContext, 
+    TaskStatus,
+    IssueStatus,
+    backlog_lifespan,
     initialize_issue, 
     add_task, 
     list_tasks, 
-    update_task_status
+    update_task_status,
+    update_issue_status,
+    list_issues,
+    select_issue,
+    _load_tasks,
+    _write_snapshot,
+    _flush_tasks
 )
 
 load_dotenv()
@@ -31,8 +44,12 @@ class MockRequestContext:
 def temp_tasks_file():
     with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
         yield f.name
-    # Clean up the file after the test
+    # Clean up the file, its change log and its lock file after the test
     os.unlink(f.name)
+    backlog_ctx = BacklogContext(tasks_file=f.name)
+    for path in (backlog_ctx.log_file, backlog_ctx.lock_file):
+        if os.path.exists(path):
+            os.unlink(path)
 
 @pytest.mark.asyncio
 async def test_initialize_issue(temp_tasks_file):
@@ -146,6 +163,11 @@ async def test_list_tasks_with_status_filter(temp_tasks_file):
     assert "Tasks for issue: Test Issue" in result
     assert "Task 1" in result
     assert "Task 2" not in result
+    
+    # No task has this status
+    result = await list_tasks(ctx, status="Done")
+    
+    assert result == "No tasks found with status 'Done'"
 
 @pytest.mark.asyncio
 async def test_invalid_status(temp_tasks_file):
@@ -164,4 +186,371 @@ async def test_invalid_status(temp_tasks_file):
     # Try to update with an invalid status
     result = await update_task_status(ctx, task_id, "Invalid")
     
-    assert "Error: Invalid status" in result
\ No newline at end of file
+    assert "Error: Invalid status" in result
+
+@pytest.mark.asyncio
+async def test_load_tasks_cache(temp_tasks_file):
+    ctx = MockContext(temp_tasks_file)
+    backlog_ctx = ctx.request_context.lifespan_context
+    
+    await initialize_issue(ctx, "Test Issue", "This is a test issue")
+    
+    # Unchanged file is served from the cache
+    assert await _load_tasks(backlog_ctx) is await _load_tasks(backlog_ctx)
+    
+    # An external edit changes the mtime and forces a re-read
+    with open(temp_tasks_file, "w") as f:
+        json.dump({"issues": {"Other Issue": {"description": "", "status": "New", "tasks": {}}}}, f)
+    stat = os.stat(temp_tasks_file)
+    os.utime(temp_tasks_file, ns=(stat.st_atime_ns, backlog_ctx._cache_mtime + 1))
+    
+    data = await _load_tasks(backlog_ctx)
+    assert "Other Issue" in data["issues"]
+    assert "Test Issue" not in data["issues"]
+
+@pytest.mark.asyncio
+async def test_batched_writes(temp_tasks_file):
+    ctx = MockContext(temp_tasks_file)
+    backlog_ctx = ctx.request_context.lifespan_context
+    backlog_ctx.flush_interval = 60
+    
+    await initialize_issue(ctx, "Test Issue", "This is a test issue")
+    await add_task(ctx, "Test Task", "This is a test task")
+    
+    # Changes are served from memory but not yet on disk
+    assert backlog_ctx.dirty
+    assert os.path.getsize(temp_tasks_file) == 0
+    assert "Test Task" in await list_tasks(ctx)
+    
+    await _flush_tasks(backlog_ctx)
+    
+    assert not backlog_ctx.dirty
+    with open(temp_tasks_file, "r") as f:
+        data = json.load(f)
+    assert len(data["issues"]["Test Issue"]["tasks"]) == 1
+
+@pytest.mark.asyncio
+async def test_lifespan_flushes_on_shutdown(temp_tasks_file, monkeypatch):
+    monkeypatch.setenv("TASKS_FILE", temp_tasks_file)
+    monkeypatch.setenv("FLUSH_INTERVAL", "60")
+    ctx = MockContext(temp_tasks_file)
+    
+    async with backlog_lifespan(None) as backlog_ctx:
+        ctx.request_context.lifespan_context = backlog_ctx
+        await initialize_issue(ctx, "Test Issue", "This is a test issue")
+        assert os.path.getsize(temp_tasks_file) == 0
+    
+    with open(temp_tasks_file, "r") as f:
+        data = json.load(f)
+    assert "Test Issue" in data["issues"]
+
+@pytest.mark.asyncio
+async def test_tasks_by_status_index(temp_tasks_file):
+    # The index is rebuilt from the task statuses, ignoring a stale stored one
+    with open(temp_tasks_file, "w") as f:
+        json.dump({"issues": {"Test Issue": {"description": "", "status": "New", "tasks": {
+            "aaaa1111": {"title": "Task 1", "description": "", "status": "New"},
+            "bbbb2222": {"title": "Task 2", "description": "", "status": "Done"}
+        }, "tasks_by_status": {"New": ["aaaa1111", "bbbb2222"]}}}}, f)
+    
+    ctx = MockContext(temp_tasks_file)
+    backlog_ctx = ctx.request_context.lifespan_context
+    backlog_ctx.active_issue = "Test Issue"
+    
+    result = await list_tasks(ctx, status="Done")
+    assert "Task 2" in result
+    assert "Task 1" not in result
+    
+    result = await update_task_status(ctx, "bbbb2222", "InWork")
+    assert "Successfully updated task" in result
+    
+    data = await _load_tasks(backlog_ctx)
+    assert data["issues"]["Test Issue"]["tasks_by_status"] == {
+        "New": {"aaaa1111": None},
+        "InWork": {"bbbb2222": None},
+        "Done": {}
+    }
+    
+    # The index is derived, so it is not saved
+    with open(temp_tasks_file, "r") as f:
+        data = json.load(f)
+    assert "tasks_by_status" not in data["issues"]["Test Issue"]
+    assert data["issues"]["Test Issue"]["tasks"]["bbbb2222"]["status"] == "InWork"
+
+@pytest.mark.asyncio
+async def test_change_log_replay(temp_tasks_file):
+    ctx = MockContext(temp_tasks_file)
+    backlog_ctx = ctx.request_context.lifespan_context
+    backlog_ctx.snapshot_every = 100
+    
+    await initialize_issue(ctx, "Test Issue", "This is a test issue")
+    await add_task(ctx, "Test Task", "This is a test task")
+    
+    # Changes are appended to the log instead of rewriting the tasks file
+    assert os.path.getsize(temp_tasks_file) == 0
+    with open(backlog_ctx.log_file, "r") as f:
+        ops = [json.loads(line) for line in f]
+    assert [op["op"] for op in ops] == ["init_issue", "add_task"]
+    
+    # The log is named after the full tasks file name
+    assert backlog_ctx.log_file == temp_tasks_file + ".log.jsonl"
+    
+    # A fresh context replays the log over the tasks file
+    other_ctx = MockContext(temp_tasks_file)
+    other_ctx.request_context.lifespan_context.active_issue = "Test Issue"
+    assert "Test Task" in await list_tasks(other_ctx)
+    
+    # A snapshot folds the log into the tasks file
+    await _flush_tasks(backlog_ctx, snapshot=True)
+    
+    assert os.path.getsize(backlog_ctx.log_file) == 0
+    with open(temp_tasks_file, "r") as f:
+        data = json.load(f)
+    assert len(data["issues"]["Test Issue"]["tasks"]) == 1
+
+@pytest.mark.asyncio
+async def test_large_snapshot_write(temp_tasks_file, monkeypatch):
+    # Force the O_DIRECT path (or its buffered fallback) for a small backlog
+    monkeypatch.setattr("backlog_manager.main._DIRECT_IO_THRESHOLD", 0)
+    ctx = MockContext(temp_tasks_file)
+    
+    await initialize_issue(ctx, "Test Issue", "x" * 5000)
+    
+    # The block padding is truncated away
+    with open(temp_tasks_file, "r") as f:
+        data = json.load(f)
+    assert data["issues"]["Test Issue"]["description"] == "x" * 5000
+
+@pytest.mark.asyncio
+async def test_list_output_cache(temp_tasks_file):
+    ctx = MockContext(temp_tasks_file)
+    
+    await initialize_issue(ctx, "Test Issue", "This is a test issue")
+    await add_task(ctx, "Task 1", "Description 1")
+    
+    # Unchanged data returns the previously formatted output
+    result = await list_tasks(ctx)
+    assert await list_tasks(ctx) is result
+    
+    # Any change invalidates it
+    await add_task(ctx, "Task 2", "Description 2")
+    result = await list_tasks(ctx)
+    
+    assert "Task 1" in result
+    assert "Task 2" in result
+
+@pytest.mark.asyncio
+async def test_update_status_no_op(temp_tasks_file):
+    ctx = MockContext(temp_tasks_file)
+    
+    await initialize_issue(ctx, "Test Issue", "This is a test issue")
+    await add_task(ctx, "Test Task", "This is a test task")
+    
+    with open(temp_tasks_file, "r") as f:
+        data = json.load(f)
+    
+    task_id = list(data["issues"]["Test Issue"]["tasks"].keys())[0]
+    mtime = os.stat(temp_tasks_file).st_mtime_ns
+    
+    # Setting the current status leaves the file untouched
+    result = await update_task_status(ctx, task_id, "New")
+    assert f"(ID: {task_id}) already has status 'New'" in result
+    
+    result = await update_issue_status(ctx, "Test Issue", "New")
+    assert result == "Issue 'Test Issue' already has status 'New'."
+    
+    assert os.stat(temp_tasks_file).st_mtime_ns == mtime
+    
+    # Invalid statuses are still rejected
+    result = await update_issue_status(ctx, "Test Issue", "Invalid")
+    assert "Error: Invalid status" in result
+
+@pytest.mark.asyncio
+async def test_flush_many_pending_ops(temp_tasks_file):
+    ctx = MockContext(temp_tasks_file)
+    backlog_ctx = ctx.request_context.lifespan_context
+    backlog_ctx.flush_interval = 60
+    backlog_ctx.snapshot_every = 5000
+    
+    await initialize_issue(ctx, "Test Issue", "This is a test issue")
+    for i in range(1100):
+        await add_task(ctx, f"Task {i}")
+    
+    # More lines than one writev call accepts still reach the log
+    await _flush_tasks(backlog_ctx)
+    
+    assert not backlog_ctx.dirty
+    with open(backlog_ctx.log_file, "r") as f:
+        assert sum(1 for _ in f) == 1101
+
+@pytest.mark.asyncio
+async def test_load_tasks_missing_fields(temp_tasks_file):
+    # Tasks written without a description or with a null status still load
+    with open(temp_tasks_file, "w") as f:
+        json.dump({"issues": {
+            "Issue 1": {"description": "First", "status": "New", "tasks": {
+                "aaaa1111": {"title": "Task 1", "status": "New"},
+                "bbbb2222": {"title": "Task 2", "description": "", "status": None}
+            }},
+            "Issue 2": {"description": "Second", "status": None, "tasks": {}}
+        }}, f)
+    
+    ctx = MockContext(temp_tasks_file)
+    
+    result = await list_issues(ctx)
+    assert "Issue 1" in result
+    assert "- Issue 2: Status: New" in result
+    
+    await select_issue(ctx, "Issue 1")
+    result = await list_tasks(ctx)
+    assert "Task 1" in result
+    assert "Title: Task 2\nStatus: New" in result
+
+@pytest.mark.asyncio
+async def test_reads_do_not_wait_on_lock(temp_tasks_file):
+    ctx = MockContext(temp_tasks_file)
+    backlog_ctx = ctx.request_context.lifespan_context
+    
+    await initialize_issue(ctx, "Test Issue", "This is a test issue")
+    await add_task(ctx, "Test Task", "This is a test task")
+    
+    # A valid cache is served while a flush holds the lock
+    async with backlog_ctx._lock:
+        result = await asyncio.wait_for(list_tasks(ctx), timeout=1)
+    
+    assert "Test Task" in result
+
+@pytest.mark.asyncio
+async def test_concurrent_snapshots(temp_tasks_file):
+    # Sessions sharing a tasks file may snapshot at the same time
+    log_path = temp_tasks_file + ".log.jsonl"
+    payloads = [json.dumps({"issues": {f"Issue {i}": {}}}).encode() for i in range(20)]
+    
+    await asyncio.gather(*[
+        asyncio.to_thread(_write_snapshot, temp_tasks_file, log_path, payload)
+        for payload in payloads
+    ])
+    
+    with open(temp_tasks_file, "rb") as f:
+        assert f.read() in payloads
+    
+    # No temporary files are left behind
+    directory, name = os.path.split(temp_tasks_file)
+    assert not [f for f in os.listdir(directory) if f.startswith(name) and f.endswith(".tmp")]
+
+@pytest.mark.asyncio
+async def test_update_status_enum_members(temp_tasks_file):
+    ctx = MockContext(temp_tasks_file)
+    
+    await initialize_issue(ctx, "Test Issue", "This is a test issue")
+    result = await add_task(ctx, "Test Task", "This is a test task")
+    task_id = result.split("(ID: ")[1].split(")")[0]
+    
+    # Enum members are accepted and stored as their plain values
+    result = await update_task_status(ctx, task_id, TaskStatus.DONE)
+    assert result.endswith("status from 'New' to 'Done'.")
+    
+    result = await update_issue_status(ctx, "Test Issue", IssueStatus.IN_WORK)
+    assert result == "Successfully updated issue 'Test Issue' status from 'New' to 'InWork'."
+    
+    with open(temp_tasks_file, "r") as f:
+        data = json.load(f)
+    assert data["issues"]["Test Issue"]["status"] == "InWork"
+    assert data["issues"]["Test Issue"]["tasks"][task_id]["status"] == "Done"
+
+@pytest.mark.asyncio
+async def test_filtered_list_order(temp_tasks_file):
+    ctx = MockContext(temp_tasks_file)
+    
+    await initialize_issue(ctx, "Test Issue", "This is a test issue")
+    result = await add_task(ctx, "Task A")
+    task_id = result.split("(ID: ")[1].split(")")[0]
+    await add_task(ctx, "Task B")
+    
+    # Moving a task away from a status and back keeps its listing position
+    await update_task_status(ctx, task_id, "Done")
+    await update_task_status(ctx, task_id, "New")
+    
+    result = await list_tasks(ctx, status="New")
+    assert result.index("Task A") < result.index("Task B")
+    
+    # A fresh load lists the tasks in the same order
+    other_ctx = MockContext(temp_tasks_file)
+    other_ctx.request_context.lifespan_context.active_issue = "Test Issue"
+    assert await list_tasks(other_ctx, status="New") == result
+
+@pytest.mark.asyncio
+async def test_snapshot_syncs_rename_before_truncate(temp_tasks_file, monkeypatch):
+    ctx = MockContext(temp_tasks_file)
+    backlog_ctx = ctx.request_context.lifespan_context
+    backlog_ctx.snapshot_every = 100
+    
+    await initialize_issue(ctx, "Test Issue", "This is a test issue")
+    
+    calls = []
+    fsync, truncate = os.fsync, os.truncate
+    monkeypatch.setattr(os, "fsync", lambda fd: (calls.append(("fsync", stat.S_ISDIR(os.fstat(fd).st_mode))), fsync(fd)))
+    monkeypatch.setattr(os, "truncate", lambda path, length: (calls.append(("truncate", path)), truncate(path, length)))
+    
+    await _flush_tasks(backlog_ctx, snapshot=True)
+    
+    # The directory holding the tasks file is synced before the log is emptied
+    assert calls.index(("fsync", True)) < calls.index(("truncate", backlog_ctx.log_file))
+
+@pytest.mark.asyncio
+async def test_failed_append_is_retried(temp_tasks_file, monkeypatch):
+    ctx = MockContext(temp_tasks_file)
+    backlog_ctx = ctx.request_context.lifespan_context
+    backlog_ctx.snapshot_every = 100
+    
+    await initialize_issue(ctx, "Test Issue", "This is a test issue")
+    
+    # The disk fills up partway through the first append
+    def fail_write(fd, chunks):
+        os.write(fd, chunks[0][:10])
+        raise OSError(errno.ENOSPC, "No space left on device")
+    monkeypatch.setattr("backlog_manager.main._write_fd", fail_write)
+    await add_task(ctx, "Task 1")
+    assert backlog_ctx.dirty
+    
+    # The next flush retries the change after removing the partial line
+    monkeypatch.undo()
+    await add_task(ctx, "Task 2")
+    assert not backlog_ctx.dirty
+    
+    other_ctx = MockContext(temp_tasks_file)
+    other_ctx.request_context.lifespan_context.active_issue = "Test Issue"
+    result = await list_tasks(other_ctx)
+    assert "Task 1" in result
+    assert "Task 2" in result
+    assert "Task 1" in await list_tasks(ctx)
+
+@pytest.mark.asyncio
+async def test_append_during_other_snapshot(temp_tasks_file, monkeypatch):
+    # Two sessions share the tasks file, each with its own context
+    ctx = MockContext(temp_tasks_file)
+    other_ctx = MockContext(temp_tasks_file)
+    other_ctx.request_context.lifespan_context.snapshot_every = 100
+    
+    await initialize_issue(ctx, "Test Issue", "This is a test issue")
+    other_ctx.request_context.lifespan_context.active_issue = "Test Issue"
+    
+    # Slow down snapshots so the other session appends while one is written
+    def slow_snapshot(*args):
+        time.sleep(0.2)
+        return _write_snapshot(*args)
+    monkeypatch.setattr("backlog_manager.main._write_snapshot", slow_snapshot)
+    
+    async def add_during_snapshot():
+        await asyncio.sleep(0.05)
+        return await add_task(other_ctx, "Task B")
+    
+    results = await asyncio.gather(add_task(ctx, "Task A"), add_during_snapshot())
+    assert all("Successfully added task" in result for result in results)
+    
+    # Neither change is lost from disk
+    fresh_ctx = MockContext(temp_tasks_file)
+    fresh_ctx.request_context.lifespan_context.active_issue = "Test Issue"
+    result = await list_tasks(fresh_ctx)
+    assert "Task A" in result
+    assert "Task B" in result